@@ -6,6 +6,11 @@ Ustad-Bias Plugin - Cognitive bias detection and mitigation
 import json
 import sys
 
+try:
+    import ahocorasick
+except ImportError:  # optional speedup, falls back to substring tests
+    ahocorasick = None
+
 COGNITIVE_BIASES = {
     "confirmation": ["only", "always", "never", "proves", "definitely"],
     "anchoring": ["first", "initial", "originally", "based on"],
@@ -16,14 +21,37 @@ COGNITIVE_BIASES = {
     "sunk_cost": ["already invested", "spent time", "put effort"]
 }
 
+def _build_automaton():
+    """Build one automaton over all indicators, or None without pyahocorasick."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for bias_type, indicators in COGNITIVE_BIASES.items():
+        for indicator in indicators:
+            automaton.add_word(indicator, (bias_type, indicator))
+    automaton.make_automaton()
+    return automaton
+
+_COG_AUTO = _build_automaton()
+
+def _find_indicators(text_lower: str) -> set:
+    """Return the (bias_type, indicator) pairs found in text_lower."""
+    if _COG_AUTO is None:
+        return {(bias_type, indicator)
+                for bias_type, indicators in COGNITIVE_BIASES.items()
+                for indicator in indicators
+                if indicator in text_lower}
+    return {hit for _, hit in _COG_AUTO.iter(text_lower)}
+
 def detect_bias(text: str) -> dict:
     """Detect cognitive biases in text."""
-    text_lower = text.lower()
+    found = _find_indicators(text.lower())
     detected = []
     
+    # Report in table order, once per indicator
     for bias_type, indicators in COGNITIVE_BIASES.items():
         for indicator in indicators:
-            if indicator in text_lower:
+            if (bias_type, indicator) in found:
                 detected.append({
                     "bias": bias_type,
                     "indicator": indicator,
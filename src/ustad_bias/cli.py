@@ -3,12 +3,58 @@
 Command-line interface for ustad-bias
 """
 
+import os
 import sys
+import codecs
+import mmap
+import stat
 import argparse
 import json
 import yaml
 from .detector import BiasDetector, RiskLevel, ComplianceFramework
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+# risk_level values that make 'check' exit non-zero
+_BLOCKING_RISK_LEVELS = frozenset({RiskLevel.CRITICAL.value, RiskLevel.HIGH.value})
+
+# libyaml's C emitter when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+def _stdout_is_utf8():
+    """Whether stdout can print the raw UTF-8 that orjson emits"""
+    try:
+        return codecs.lookup(sys.stdout.encoding).name == 'utf-8'
+    except (AttributeError, LookupError, TypeError):
+        return False
+
+
+def _format(result, as_json):
+    """Render a result as JSON (for machines) or YAML (human-readable)"""
+    if as_json:
+        # orjson cannot escape non-ASCII, so other consoles keep json.dumps
+        if orjson is not None and _stdout_is_utf8():
+            option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            return orjson.dumps(result, option=option).decode()
+        return json.dumps(result, indent=2)
+    return yaml.dump(result, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
+
+
+def _check_file(detector, path, verbose, fast_gate):
+    """Check a file, memory-mapping regular files instead of reading them whole"""
+    with open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        # Pipes, FIFOs and /dev/stdin report size 0 and cannot be mapped
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            content = f.read().decode('utf-8', 'replace')
+            return detector.check(content, verbose=verbose, fast_gate=fast_gate)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return detector.check_stream(buf, verbose=verbose, fast_gate=fast_gate)
+
 
 def main():
     """Main CLI entry point"""
@@ -19,6 +65,7 @@ def main():
 Examples:
   ustad-bias check "facial recognition system"
   ustad-bias check --file app.py --verbose
+  ustad-bias check --file app.py --fast
   ustad-bias validate --framework hippocratic "drone control system"
   ustad-bias principles --framework un_human_rights
         '''
@@ -32,6 +79,9 @@ Examples:
     check_group.add_argument('content', nargs='?', help='Text to check')
     check_group.add_argument('--file', help='File to check')
     check_parser.add_argument('--verbose', action='store_true', help='Detailed analysis')
+    check_parser.add_argument('--fast', action='store_true',
+                              help='Stop at the first blocking verdict '
+                                   '(concerns may be incomplete)')
     check_parser.add_argument('--json', action='store_true', help='Output as JSON (for machines)')
     check_parser.add_argument('--yaml', action='store_true', help='Output as YAML (human-readable, default)')
     
@@ -62,24 +112,17 @@ Examples:
     
     try:
         if args.command == 'check':
-            # Get content
+            # Check content, streaming files instead of reading them whole
             if args.file:
-                with open(args.file, 'r') as f:
-                    content = f.read()
+                result = _check_file(detector, args.file, args.verbose, args.fast)
             else:
-                content = args.content
-            
-            # Check content
-            result = detector.check(content, verbose=args.verbose)
+                result = detector.check(args.content, verbose=args.verbose, fast_gate=args.fast)
             
             # Output result
-            if args.json:
-                print(json.dumps(result, indent=2))
-            else:
-                print(yaml.dump(result, default_flow_style=False, sort_keys=False))
+            print(_format(result, args.json))
             
             # Return appropriate exit code
-            if result['risk_level'] in ['critical', 'high']:
+            if result['risk_level'] in _BLOCKING_RISK_LEVELS:
                 return 1
         
         elif args.command == 'validate':
@@ -90,10 +133,7 @@ Examples:
             result = detector.validate(args.content, framework)
             
             # Output result
-            if args.json:
-                print(json.dumps(result, indent=2))
-            else:
-                print(yaml.dump(result, default_flow_style=False, sort_keys=False))
+            print(_format(result, args.json))
             
             # Return appropriate exit code
             if not result['valid']:
@@ -109,10 +149,7 @@ Examples:
             result = detector.get_principles(framework)
             
             # Output result
-            if args.json:
-                print(json.dumps(result, indent=2))
-            else:
-                print(yaml.dump(result, default_flow_style=False, sort_keys=False))
+            print(_format(result, args.json))
     
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -5,10 +5,108 @@ This module implements the Hippocratic License principle:
 "First, Do No Harm"
 """
 
+import codecs
+import functools
+import mmap
 import re
-from typing import Dict, Any, List, Optional
+from datetime import datetime
+from types import MappingProxyType
+from typing import (
+    Dict, Any, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+)
 from enum import Enum
 
+try:
+    import ahocorasick
+except ImportError:  # optional speedup, see the "fast" extra
+    ahocorasick = None
+
+
+# Regex checks compiled once at import. Each entry keeps its source string
+# so concerns can keep reporting the pattern that fired, plus the literal
+# words one of which every match must contain. Those anchors go into the
+# shared keyword scan, and a pattern is only searched when an anchor hit.
+_DISCRIMINATION_PATTERNS = tuple(
+    (re.compile(pattern), pattern, anchors) for pattern, anchors in (
+        (r'\b(race|racial|ethnic)\s+(profiling|discrimination)', ("race", "racial", "ethnic")),
+        (r'\b(gender|sex)\s+(bias|discrimination)', ("gender", "sex")),
+        (r'\b(religious|religion)\s+(discrimination|persecution)', ("religious", "religion")),
+        (r'\bdeny\s+\w+\s+based\s+on', ("deny",)),
+        (r'\bexclude\s+\w+\s+(from|because)', ("exclude",)),
+    )
+)
+
+_PRIVACY_PATTERNS = tuple(
+    (re.compile(pattern), pattern, anchors) for pattern, anchors in (
+        (r'\b(track|monitor|spy)\s+(on\s+)?(users|individuals|people)',
+         ("track", "monitor", "spy")),
+        (r'\bcollect\s+personal\s+data\s+without', ("collect",)),
+        (r'\bmass\s+surveillance', ("mass",)),
+        (r'\bfacial\s+recognition', ("facial",)),
+    )
+)
+
+# check_stream() decodes and scans this many bytes at a time, carrying the
+# last _STREAM_OVERLAP characters over so matches across chunks are kept.
+_STREAM_CHUNK_SIZE = 1 << 20
+_STREAM_OVERLAP = 256
+
+# Below this many keywords, separate substring tests (memchr-accelerated in
+# CPython) beat walking every character through an Aho-Corasick automaton
+_AUTOMATON_MIN_KEYWORDS = 20
+
+_SCAN_BUCKETS = ("prohibited", "un", "un_violation", "pattern", "use", "gdpr", "ethics")
+
+
+class _KeywordAutomaton:
+    """
+    Multi-keyword substring matcher
+
+    Scans the text once with an Aho-Corasick automaton when pyahocorasick is
+    installed and there are enough keywords to pay for it, and falls back to
+    one substring test per keyword otherwise.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, Any]]):
+        self._keywords: Dict[str, List[Any]] = {}
+        for keyword, payload in entries:
+            self._keywords.setdefault(keyword, []).append(payload)
+
+        self._automaton = None
+        if ahocorasick is not None and len(self._keywords) >= _AUTOMATON_MIN_KEYWORDS:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, payloads in self._keywords.items():
+                self._automaton.add_word(keyword, (keyword, payloads))
+            self._automaton.make_automaton()
+
+    def iter(self, text: str) -> Iterator[Any]:
+        """Yield the payloads of every keyword found in text, once per keyword"""
+        if self._automaton is None:
+            for keyword, payloads in self._keywords.items():
+                if keyword in text:
+                    yield from payloads
+            return
+
+        seen = set()
+        for _, (keyword, payloads) in self._automaton.iter(text):
+            if keyword not in seen:
+                seen.add(keyword)
+                yield from payloads
+
+
+class _Concern(NamedTuple):
+    """Single ethical concern, kept as a tuple until the result is assembled"""
+    category: str
+    keyword: Optional[str] = None
+    pattern: Optional[str] = None
+    severity: str = "medium"
+    principle_violated: Optional[str] = None
+    un_article_violated: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the public concern dict, leaving out unset fields"""
+        return {field: value for field, value in zip(self._fields, self) if value is not None}
+
 
 class RiskLevel(Enum):
     """Risk levels for ethical concerns"""
@@ -28,6 +126,18 @@ class ComplianceFramework(Enum):
     ENVIRONMENTAL = "environmental"
 
 
+# Risk levels that block content and get logged as violations
+_BLOCKING_RISK_LEVELS = frozenset({RiskLevel.HIGH, RiskLevel.CRITICAL})
+
+# Scan buckets read by each validate() framework; others need no scan
+_FRAMEWORK_BUCKETS = {
+    ComplianceFramework.UN_HUMAN_RIGHTS: frozenset({"un"}),
+    ComplianceFramework.HIPPOCRATIC: frozenset({"prohibited"}),
+    ComplianceFramework.GDPR: frozenset({"gdpr"}),
+    ComplianceFramework.AI_ETHICS: frozenset({"ethics"}),
+}
+
+
 class BiasDetector:
     """Main bias detection and ethical compliance checking class"""
     
@@ -46,53 +156,173 @@ class BiasDetector:
     }
     
     # Hippocratic License prohibited uses
-    PROHIBITED_USES = {
-        "military": ["weapon", "missile", "drone", "targeting", "warfare", "combat", "lethal", "defense system"],
-        "surveillance": ["spy", "monitor activists", "track journalists", "mass surveillance", "facial recognition"],
-        "discrimination": ["racial profiling", "gender bias", "religious discrimination", "social credit"],
-        "exploitation": ["child labor", "human trafficking", "forced labor", "sweatshop"],
-        "environmental": ["pollution", "deforestation", "toxic waste", "carbon intensive"],
-        "harm": ["torture", "abuse", "violence", "suffering", "cruelty", "harm"]
-    }
+    PROHIBITED_USES = MappingProxyType({
+        "military": ("weapon", "missile", "drone", "targeting", "warfare", "combat", "lethal", "defense system"),
+        "surveillance": ("spy", "monitor activists", "track journalists", "mass surveillance", "facial recognition"),
+        "discrimination": ("racial profiling", "gender bias", "religious discrimination", "social credit"),
+        "exploitation": ("child labor", "human trafficking", "forced labor", "sweatshop"),
+        "environmental": ("pollution", "deforestation", "toxic waste", "carbon intensive"),
+        "harm": ("torture", "abuse", "violence", "suffering", "cruelty", "harm")
+    })
+    
+    # Keywords tying content to specific UN articles
+    UN_ARTICLE_KEYWORDS = MappingProxyType({
+        1: ("dignity", "equal", "rights"),
+        2: ("discrimination", "distinction", "exclusion"),
+        3: ("life", "liberty", "security"),
+        5: ("torture", "cruel", "inhuman"),
+        12: ("privacy", "interference", "surveillance"),
+        19: ("opinion", "expression", "censorship"),
+        26: ("education", "learning", "knowledge")
+    })
+    
+    # Terms that turn a mentioned UN article into a violation
+    UN_VIOLATION_TERMS = ("deny", "restrict", "violate", "prevent")
+    
+    # Keywords hinting at how content will be used
+    USE_PATTERNS = MappingProxyType({
+        "education": ("learn", "teach", "educate", "student", "course"),
+        "healthcare": ("health", "medical", "patient", "diagnosis", "treatment"),
+        "research": ("research", "study", "analysis", "data", "scientific"),
+        "business": ("business", "commerce", "trade", "market", "customer"),
+        "social": ("social", "community", "help", "support", "assist")
+    })
+    
+    # Phrases satisfying each GDPR requirement
+    GDPR_REQUIREMENTS = MappingProxyType({
+        "consent": ("explicit consent", "user consent"),
+        "data_minimization": ("minimal data", "necessary data"),
+        "right_to_erasure": ("delete data", "right to erasure"),
+        "data_protection": ("data protection", "secure data"),
+        "transparency": ("transparent", "clear purpose")
+    })
+    
+    # AI ethics score adjustments
+    ETHICS_DEDUCTIONS = MappingProxyType({
+        "bias": 20,
+        "discriminat": 25,
+        "surveillance": 20,
+        "weapon": 40,
+        "military": 40,
+        "exploit": 30,
+        "manipulat": 25,
+        "deceiv": 20
+    })
+    
+    ETHICS_ADDITIONS = MappingProxyType({
+        "consent": 10,
+        "privacy": 10,
+        "fair": 10,
+        "transparent": 10,
+        "accountab": 10,
+        "ethical": 5,
+        "responsible": 5
+    })
     
     def __init__(self):
         """Initialize the bias detector"""
         self.checks_performed = 0
         self.violations_found = []
     
-    def check(self, content: str, verbose: bool = False) -> Dict[str, Any]:
+    def check(self, content: str, verbose: bool = False, fast_gate: bool = False) -> Dict[str, Any]:
         """
         Check content for ethical concerns
         
         Args:
             content: Text or code to analyze
             verbose: Include detailed analysis
+            fast_gate: Stop scanning once the content is certain to be blocked;
+                the concerns list may then be incomplete (ignored with verbose)
             
         Returns:
             Dictionary with risk assessment and recommendations
         """
+        # str.lower() already has a C fast path for pure-ASCII strings; a
+        # bytes.translate round trip measured 2-4x slower, so keep it simple
+        content_lower = content.lower()
+        hits = self._scan_all(content_lower, fast_gate=fast_gate and not verbose)
+        word_count = len(content.split()) if verbose else 0
+        
+        return self._build_result(hits, content[:100], verbose, word_count)
+    
+    def check_stream(self, buf: Union[bytes, mmap.mmap], verbose: bool = False,
+                     fast_gate: bool = False) -> Dict[str, Any]:
+        """
+        Check UTF-8 encoded content for ethical concerns, chunk by chunk
+        
+        Gives the same result as check() on the decoded text, but only one
+        chunk is decoded and lowercased at a time, so a memory-mapped file is
+        never held in memory as a whole. Pattern matches spanning more than
+        a few hundred characters across a chunk boundary can be missed.
+        
+        Args:
+            buf: Encoded content, e.g. an mmap of the file to check
+            verbose: Include detailed analysis
+            fast_gate: Stop reading once the content is certain to be blocked;
+                the concerns list may then be incomplete (ignored with verbose)
+            
+        Returns:
+            Dictionary with risk assessment and recommendations
+        """
+        hits: Dict[str, set] = {bucket: set() for bucket in _SCAN_BUCKETS}
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        keyword_index = self._get_keyword_index()
+        snippet = ""
+        tail = " "
+        word_count = 0
+        
+        for start in range(0, len(buf), _STREAM_CHUNK_SIZE):
+            end = start + _STREAM_CHUNK_SIZE
+            text = decoder.decode(buf[start:end], final=end >= len(buf))
+            if not text:
+                continue
+            
+            if not snippet:
+                snippet = text[:100]
+            if verbose:
+                word_count += len(text.split())
+                # A word cut in two by the chunk boundary was counted twice
+                if not tail[-1].isspace() and not text[0].isspace():
+                    word_count -= 1
+            
+            # The tail's first character only gives regexes their \b context
+            window = tail + text.lower()
+            for bucket, values in self._scan_all(window, offset=1).items():
+                hits[bucket] |= values
+            tail = window[-_STREAM_OVERLAP - 1:]
+            
+            if fast_gate and not verbose and sum(
+                keyword_index[keyword][1] == "high" for keyword in hits["prohibited"]
+            ) >= 3:
+                break
+        
+        return self._build_result(hits, snippet, verbose, word_count)
+    
+    def _build_result(self, hits: Dict[str, set], snippet: str, verbose: bool,
+                      word_count: int) -> Dict[str, Any]:
+        """Assemble the check() result from the scan hits"""
         self.checks_performed += 1
         
         # Analyze content
-        concerns = self._analyze_content(content)
-        risk_level = self._calculate_risk_level(concerns)
+        concerns, high_severity, medium_severity = self._analyze_content(hits)
+        risk_level = self._calculate_risk_level(high_severity, medium_severity)
         
         result = {
             "risk_level": risk_level.value,
-            "concerns": concerns,
+            "concerns": [concern.to_dict() for concern in concerns],
             "recommendation": self._get_recommendation(risk_level, concerns),
             "checks_performed": self.checks_performed
         }
         
         if verbose:
-            result["detailed_analysis"] = self._detailed_analysis(content)
+            result["detailed_analysis"] = self._detailed_analysis(word_count, hits)
         
         # Add warning for high-risk content
-        if risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]:
+        if risk_level in _BLOCKING_RISK_LEVELS:
             result["warning"] = "⚠️ This content raises serious ethical concerns"
             result["action"] = "BLOCKED - Violates ethical guidelines"
             self.violations_found.append({
-                "content_snippet": content[:100],
+                "content_snippet": snippet,
                 "risk_level": risk_level.value,
                 "timestamp": self._get_timestamp()
             })
@@ -115,24 +345,32 @@ class BiasDetector:
             "valid": True,
             "violations": []
         }
+        buckets = _FRAMEWORK_BUCKETS.get(framework)
+        if buckets is not None:
+            hits = self._scan_all(content.lower(), buckets=buckets)
         
         if framework == ComplianceFramework.UN_HUMAN_RIGHTS:
-            compliance = self._check_un_compliance(content)
+            # Violation terms only matter once an article is mentioned
+            if hits["un"]:
+                hits["un_violation"] = self._scan_all(
+                    content.lower(), buckets=frozenset({"un_violation"})
+                )["un_violation"]
+            compliance = self._check_un_compliance(hits)
             result["valid"] = len(compliance["articles_violated"]) == 0
             result["violations"] = compliance["articles_violated"]
             result["compliance_details"] = compliance
         
         elif framework == ComplianceFramework.HIPPOCRATIC:
-            result["valid"] = self._check_hippocratic_compliance(content)
+            result["valid"] = self._check_hippocratic_compliance(hits)
             if not result["valid"]:
-                result["violations"] = self._find_hippocratic_violations(content)
+                result["violations"] = self._find_hippocratic_violations(hits)
         
         elif framework == ComplianceFramework.GDPR:
-            result["gdpr_compliance"] = self._check_gdpr_compliance(content)
+            result["gdpr_compliance"] = self._check_gdpr_compliance(hits)
             result["valid"] = result["gdpr_compliance"]["compliant"]
         
         elif framework == ComplianceFramework.AI_ETHICS:
-            score = self._calculate_ai_ethics_score(content)
+            score = self._calculate_ai_ethics_score(hits)
             result["ethics_score"] = score
             result["valid"] = score >= 60
             if score < 60:
@@ -175,67 +413,127 @@ class BiasDetector:
                 }
             }
     
-    def _analyze_content(self, content: str) -> List[Dict[str, Any]]:
-        """Analyze content for ethical concerns"""
-        concerns = []
-        content_lower = content.lower()
-        
-        # Check for prohibited uses
-        for category, keywords in self.PROHIBITED_USES.items():
+    @classmethod
+    def _scan_entries(cls) -> Iterator[Tuple[str, Tuple[str, Any]]]:
+        """Yield (keyword, (bucket, value)) pairs for the shared automaton"""
+        for keyword in cls._get_keyword_index():
+            yield keyword, ("prohibited", keyword)
+        for article, keywords in cls.UN_ARTICLE_KEYWORDS.items():
+            for keyword in keywords:
+                yield keyword, ("un", article)
+        for term in cls.UN_VIOLATION_TERMS:
+            yield term, ("un_violation", term)
+        for use_type, keywords in cls.USE_PATTERNS.items():
             for keyword in keywords:
-                if keyword in content_lower:
-                    concerns.append({
-                        "category": category,
-                        "keyword": keyword,
-                        "severity": "high" if category in ["military", "surveillance"] else "medium",
-                        "principle_violated": "Hippocratic License - Do No Harm"
-                    })
+                yield keyword, ("use", use_type)
+        for _, pattern, anchors in _DISCRIMINATION_PATTERNS + _PRIVACY_PATTERNS:
+            for anchor in anchors:
+                yield anchor, ("pattern", pattern)
+        for requirement, phrases in cls.GDPR_REQUIREMENTS.items():
+            for phrase in phrases:
+                yield phrase, ("gdpr", requirement)
+        for term, penalty in cls.ETHICS_DEDUCTIONS.items():
+            yield term, ("ethics", (term, -penalty))
+        for term, bonus in cls.ETHICS_ADDITIONS.items():
+            yield term, ("ethics", (term, bonus))
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_keyword_index(cls) -> "MappingProxyType[str, Tuple[str, str]]":
+        """Map each prohibited keyword to (category, severity), in PROHIBITED_USES order"""
+        return MappingProxyType({
+            keyword: (category, "high" if category in ("military", "surveillance") else "medium")
+            for category, keywords in cls.PROHIBITED_USES.items()
+            for keyword in keywords
+        })
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_automaton(cls, buckets: Optional[FrozenSet[str]] = None) -> _KeywordAutomaton:
+        """
+        Build the keyword automaton once per class, bucket subset and process
         
-        # Check for discrimination patterns
-        discrimination_patterns = [
-            r'\b(race|racial|ethnic)\s+(profiling|discrimination)',
-            r'\b(gender|sex)\s+(bias|discrimination)',
-            r'\b(religious|religion)\s+(discrimination|persecution)',
-            r'\bdeny\s+\w+\s+based\s+on',
-            r'\bexclude\s+\w+\s+(from|because)',
-        ]
-        
-        for pattern in discrimination_patterns:
-            if re.search(pattern, content_lower):
-                concerns.append({
-                    "category": "discrimination",
-                    "pattern": pattern,
-                    "severity": "high",
-                    "un_article_violated": 2
-                })
+        Without buckets the automaton covers every bucket; validate() asks
+        for just the buckets its framework reads.
+        """
+        entries = cls._scan_entries()
+        if buckets is not None:
+            entries = (entry for entry in entries if entry[1][0] in buckets)
+        return _KeywordAutomaton(entries)
+    
+    def _scan_all(self, content_lower: str, fast_gate: bool = False, offset: int = 0,
+                  buckets: Optional[FrozenSet[str]] = None) -> Dict[str, set]:
+        """
+        Find every keyword in one pass over the content, grouped by bucket
         
-        # Check for privacy violations
-        privacy_patterns = [
-            r'\b(track|monitor|spy)\s+(on\s+)?(users|individuals|people)',
-            r'\bcollect\s+personal\s+data\s+without',
-            r'\bmass\s+surveillance',
-            r'\bfacial\s+recognition',
-        ]
-        
-        for pattern in privacy_patterns:
-            if re.search(pattern, content_lower):
-                concerns.append({
-                    "category": "privacy",
-                    "pattern": pattern,
-                    "severity": "medium",
-                    "un_article_violated": 12
-                })
-        
-        return concerns
+        Only the given buckets are scanned for, or all of them by default.
+        Regex checks whose anchor was found are confirmed against the same
+        lowered text, with matches starting at offset or later; the "pattern" bucket only
+        holds confirmed patterns. With fast_gate the scan stops after three high-severity prohibited
+        keywords, which already make the content CRITICAL.
+        """
+        hits: Dict[str, set] = {bucket: set() for bucket in _SCAN_BUCKETS}
+        keyword_index = self._get_keyword_index()
+        high_severity = 0
+        for bucket, value in self._get_automaton(buckets).iter(content_lower):
+            hits[bucket].add(value)
+            if fast_gate and bucket == "prohibited" and keyword_index[value][1] == "high":
+                high_severity += 1
+                if high_severity >= 3:
+                    break
+        
+        hits["pattern"] = {
+            pattern for compiled, pattern, _ in _DISCRIMINATION_PATTERNS + _PRIVACY_PATTERNS
+            if pattern in hits["pattern"] and compiled.search(content_lower, offset)
+        }
+        return hits
     
-    def _calculate_risk_level(self, concerns: List[Dict[str, Any]]) -> RiskLevel:
-        """Calculate overall risk level"""
-        if not concerns:
-            return RiskLevel.SAFE
+    def _analyze_content(self, hits: Dict[str, set]) -> Tuple[List[_Concern], int, int]:
+        """Analyze content for ethical concerns, counting high/medium severity ones"""
+        concerns = []
+        high_severity = 0
+        medium_severity = 0
+        
+        # Check for prohibited uses, reported in table order
+        for keyword, (category, severity) in self._get_keyword_index().items():
+            if keyword in hits["prohibited"]:
+                if severity == "high":
+                    high_severity += 1
+                else:
+                    medium_severity += 1
+                concerns.append(_Concern(
+                    category=category,
+                    keyword=keyword,
+                    severity=severity,
+                    principle_violated="Hippocratic License - Do No Harm"
+                ))
         
-        high_severity = sum(1 for c in concerns if c.get("severity") == "high")
-        medium_severity = sum(1 for c in concerns if c.get("severity") == "medium")
+        # Check for discrimination patterns
+        for _, pattern, _ in _DISCRIMINATION_PATTERNS:
+            if pattern in hits["pattern"]:
+                high_severity += 1
+                concerns.append(_Concern(
+                    category="discrimination",
+                    pattern=pattern,
+                    severity="high",
+                    un_article_violated=2
+                ))
         
+        # Check for privacy violations
+        for _, pattern, _ in _PRIVACY_PATTERNS:
+            if pattern in hits["pattern"]:
+                medium_severity += 1
+                concerns.append(_Concern(
+                    category="privacy",
+                    pattern=pattern,
+                    severity="medium",
+                    un_article_violated=12
+                ))
+        
+        return concerns, high_severity, medium_severity
+    
+    def _calculate_risk_level(self, high_severity: int, medium_severity: int) -> RiskLevel:
+        """Calculate overall risk level from the severity counts"""
         if high_severity >= 3:
             return RiskLevel.CRITICAL
         elif high_severity >= 1:
@@ -247,7 +545,7 @@ class BiasDetector:
         else:
             return RiskLevel.SAFE
     
-    def _get_recommendation(self, risk_level: RiskLevel, concerns: List[Dict[str, Any]]) -> str:
+    def _get_recommendation(self, risk_level: RiskLevel, concerns: List[_Concern]) -> str:
         """Get recommendation based on risk level"""
         recommendations = {
             RiskLevel.SAFE: "✅ No ethical concerns detected. Safe to proceed.",
@@ -261,7 +559,7 @@ class BiasDetector:
         
         # Add specific recommendations
         if concerns:
-            categories = set(c["category"] for c in concerns)
+            categories = set(c.category for c in concerns)
             if "military" in categories:
                 base_rec += "\n- Remove all military/weapons-related functionality"
             if "surveillance" in categories:
@@ -271,57 +569,31 @@ class BiasDetector:
         
         return base_rec
     
-    def _detailed_analysis(self, content: str) -> Dict[str, Any]:
+    def _detailed_analysis(self, word_count: int, hits: Dict[str, set]) -> Dict[str, Any]:
         """Perform detailed ethical analysis"""
         return {
-            "word_count": len(content.split()),
-            "potential_uses": self._identify_potential_uses(content),
-            "un_compliance": self._check_un_compliance(content),
-            "hippocratic_compliance": self._check_hippocratic_compliance(content),
-            "ai_ethics_score": self._calculate_ai_ethics_score(content)
+            "word_count": word_count,
+            "potential_uses": self._identify_potential_uses(hits),
+            "un_compliance": self._check_un_compliance(hits),
+            "hippocratic_compliance": self._check_hippocratic_compliance(hits),
+            "ai_ethics_score": self._calculate_ai_ethics_score(hits)
         }
     
-    def _identify_potential_uses(self, content: str) -> List[str]:
+    def _identify_potential_uses(self, hits: Dict[str, set]) -> List[str]:
         """Identify potential uses of the content"""
-        uses = []
-        content_lower = content.lower()
-        
-        use_patterns = {
-            "education": ["learn", "teach", "educate", "student", "course"],
-            "healthcare": ["health", "medical", "patient", "diagnosis", "treatment"],
-            "research": ["research", "study", "analysis", "data", "scientific"],
-            "business": ["business", "commerce", "trade", "market", "customer"],
-            "social": ["social", "community", "help", "support", "assist"]
-        }
-        
-        for use_type, keywords in use_patterns.items():
-            if any(keyword in content_lower for keyword in keywords):
-                uses.append(use_type)
-        
-        return uses
+        # Keep the USE_PATTERNS order rather than the order of the hits
+        return [use_type for use_type in self.USE_PATTERNS if use_type in hits["use"]]
     
-    def _check_un_compliance(self, content: str) -> Dict[str, Any]:
+    def _check_un_compliance(self, hits: Dict[str, set]) -> Dict[str, Any]:
         """Check compliance with UN Declaration of Human Rights"""
         violations = []
         supported = []
         
-        content_lower = content.lower()
-        
         # Check each UN article
-        article_keywords = {
-            1: ["dignity", "equal", "rights"],
-            2: ["discrimination", "distinction", "exclusion"],
-            3: ["life", "liberty", "security"],
-            5: ["torture", "cruel", "inhuman"],
-            12: ["privacy", "interference", "surveillance"],
-            19: ["opinion", "expression", "censorship"],
-            26: ["education", "learning", "knowledge"]
-        }
-        
-        for article, keywords in article_keywords.items():
-            if any(keyword in content_lower for keyword in keywords):
+        for article in self.UN_ARTICLE_KEYWORDS:
+            if article in hits["un"]:
                 # Determine if it's a violation or support
-                if any(neg in content_lower for neg in ["deny", "restrict", "violate", "prevent"]):
+                if hits["un_violation"]:
                     violations.append(article)
                 else:
                     supported.append(article)
@@ -332,39 +604,26 @@ class BiasDetector:
             "compliance_score": len(supported) - len(violations)
         }
     
-    def _check_hippocratic_compliance(self, content: str) -> bool:
+    def _check_hippocratic_compliance(self, hits: Dict[str, set]) -> bool:
         """Check Hippocratic License compliance"""
-        content_lower = content.lower()
-        
-        # Check for any prohibited use
-        for keywords in self.PROHIBITED_USES.values():
-            if any(keyword in content_lower for keyword in keywords):
-                return False
-        
-        return True
+        # Any prohibited use is a violation
+        return not hits["prohibited"]
     
-    def _find_hippocratic_violations(self, content: str) -> List[str]:
+    def _find_hippocratic_violations(self, hits: Dict[str, set]) -> List[str]:
         """Find specific Hippocratic License violations"""
         violations = []
-        content_lower = content.lower()
         
-        for category, keywords in self.PROHIBITED_USES.items():
-            for keyword in keywords:
-                if keyword in content_lower:
-                    violations.append(f"{category}: {keyword}")
+        for keyword, (category, _) in self._get_keyword_index().items():
+            if keyword in hits["prohibited"]:
+                violations.append(f"{category}: {keyword}")
         
         return violations
     
-    def _check_gdpr_compliance(self, content: str) -> Dict[str, Any]:
+    def _check_gdpr_compliance(self, hits: Dict[str, set]) -> Dict[str, Any]:
         """Basic GDPR compliance check"""
-        content_lower = content.lower()
-        
         gdpr_requirements = {
-            "consent": "explicit consent" in content_lower or "user consent" in content_lower,
-            "data_minimization": "minimal data" in content_lower or "necessary data" in content_lower,
-            "right_to_erasure": "delete data" in content_lower or "right to erasure" in content_lower,
-            "data_protection": "data protection" in content_lower or "secure data" in content_lower,
-            "transparency": "transparent" in content_lower or "clear purpose" in content_lower
+            requirement: requirement in hits["gdpr"]
+            for requirement in self.GDPR_REQUIREMENTS
         }
         
         met_requirements = sum(1 for req in gdpr_requirements.values() if req)
@@ -376,45 +635,13 @@ class BiasDetector:
             "details": gdpr_requirements
         }
     
-    def _calculate_ai_ethics_score(self, content: str) -> float:
+    def _calculate_ai_ethics_score(self, hits: Dict[str, set]) -> float:
         """Calculate AI ethics score (0-100)"""
-        score = 100.0
-        content_lower = content.lower()
-        
-        # Deduct points for ethical concerns
-        deductions = {
-            "bias": 20,
-            "discriminat": 25,
-            "surveillance": 20,
-            "weapon": 40,
-            "military": 40,
-            "exploit": 30,
-            "manipulat": 25,
-            "deceiv": 20
-        }
-        
-        for term, penalty in deductions.items():
-            if term in content_lower:
-                score -= penalty
-        
-        # Add points for positive ethics
-        additions = {
-            "consent": 10,
-            "privacy": 10,
-            "fair": 10,
-            "transparent": 10,
-            "accountab": 10,
-            "ethical": 5,
-            "responsible": 5
-        }
-        
-        for term, bonus in additions.items():
-            if term in content_lower:
-                score += bonus
+        # Each matched term carries its signed adjustment and counts once
+        score = 100.0 + sum(delta for _, delta in hits["ethics"])
         
         return max(0, min(100, score))
     
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
         return datetime.now().isoformat()
\ No newline at end of file
@@ -0,0 +1,219 @@
+"""
+Tests for the bias detector and its command-line interface
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import ustad_bias.detector
+from ustad_bias import BiasDetector, ComplianceFramework
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+BLOCKED_TEXT = "develop drone targeting system with weapon support"
+
+
+def run_cli(*args, stdin=None, **env_vars):
+    """Run the CLI in a subprocess and return the completed process"""
+    env = dict(os.environ, PYTHONPATH=SRC_DIR, **env_vars)
+    return subprocess.run(
+        [sys.executable, "-m", "ustad_bias.cli", *args],
+        input=stdin, capture_output=True, text=True, env=env
+    )
+
+
+def test_cli_check_file_from_pipe():
+    """Pipes report size 0 but must still be read and checked"""
+    proc = run_cli("check", "--file", "/dev/stdin", stdin=BLOCKED_TEXT)
+    assert proc.returncode == 1
+    assert "risk_level: critical" in proc.stdout
+
+
+def test_cli_check_regular_file(tmp_path):
+    path = tmp_path / "app.txt"
+    path.write_text(BLOCKED_TEXT)
+    proc = run_cli("check", "--file", str(path))
+    assert proc.returncode == 1
+    assert "risk_level: critical" in proc.stdout
+
+
+def test_cli_check_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+    proc = run_cli("check", "--file", str(path))
+    assert proc.returncode == 0
+    assert "risk_level: safe" in proc.stdout
+
+
+def test_cli_json_on_ascii_console():
+    """Emoji in recommendations must not break non-UTF-8 consoles"""
+    proc = run_cli("check", "hello world", "--json", PYTHONIOENCODING="ascii")
+    assert proc.returncode == 0
+    assert "\\u2705" in proc.stdout
+
+
+def test_subclass_prohibited_uses_override():
+    """Keyword index and automaton follow a subclass's own tables"""
+    class StrictDetector(BiasDetector):
+        PROHIBITED_USES = {"military": ["nuke"]}
+
+    concerns = StrictDetector().check("nuke the weapon")["concerns"]
+    assert [c.get("keyword") for c in concerns] == ["nuke"]
+    concerns = BiasDetector().check("nuke the weapon")["concerns"]
+    assert [c.get("keyword") for c in concerns] == ["weapon"]
+
+
+STREAM_TEXTS = [
+    "",
+    "educational platform for children",
+    "develop drone targeting system for the military",
+    "Ünïcödé İstanbul çalışması: deny   women based on religion",
+    "racial\tprofiling and 👁️ mass  surveillance of activists — exclude them from voting",
+    "ğğğğ weapon ğğğğ explicit consent, minimal data, delete data, transparent ✅",
+    "İracial profiling",
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+@pytest.mark.parametrize("text", STREAM_TEXTS)
+@pytest.mark.parametrize("verbose", [False, True])
+def test_check_stream_matches_check(monkeypatch, chunk_size, text, verbose):
+    """Chunking must not lose keywords, patterns or words across boundaries"""
+    monkeypatch.setattr(ustad_bias.detector, "_STREAM_CHUNK_SIZE", chunk_size)
+    expected = BiasDetector().check(text, verbose=verbose)
+    assert BiasDetector().check_stream(text.encode(), verbose=verbose) == expected
+
+
+def test_regex_word_boundary_after_case_folding():
+    """Regexes see the lowered text, where İ becomes i plus a combining dot"""
+    concerns = BiasDetector().check("İracial profiling")["concerns"]
+    assert [c["pattern"] for c in concerns if "pattern" in c] == [
+        r"\b(race|racial|ethnic)\s+(profiling|discrimination)"
+    ]
+
+
+def test_check_stream_keyword_straddles_chunks(monkeypatch):
+    monkeypatch.setattr(ustad_bias.detector, "_STREAM_CHUNK_SIZE", 4)
+    result = BiasDetector().check_stream("launch the missile".encode(), verbose=True)
+    assert [c.get("keyword") for c in result["concerns"]] == ["missile"]
+    assert result["detailed_analysis"]["word_count"] == 3
+
+
+def test_fast_gate_blocks_after_three_high_severity_hits():
+    text = "weapon missile drone targeting warfare for combat"
+    full = BiasDetector().check(text)
+    fast = BiasDetector().check(text, fast_gate=True)
+    assert full["risk_level"] == fast["risk_level"] == "critical"
+    assert len(fast["concerns"]) == 3
+    assert len(full["concerns"]) == 6
+    assert fast["action"] == "BLOCKED - Violates ethical guidelines"
+
+
+def test_fast_gate_below_threshold_matches_full_check():
+    text = "a drone for teaching students about pollution"
+    assert BiasDetector().check(text, fast_gate=True) == BiasDetector().check(text)
+
+
+def test_fast_gate_ignored_when_verbose():
+    text = "weapon missile drone targeting warfare"
+    assert BiasDetector().check(text, verbose=True, fast_gate=True) == \
+        BiasDetector().check(text, verbose=True)
+
+
+def test_check_stream_fast_gate(monkeypatch):
+    monkeypatch.setattr(ustad_bias.detector, "_STREAM_CHUNK_SIZE", 8)
+    text = "weapon missile drone targeting warfare " + "harmless filler " * 50
+    result = BiasDetector().check_stream(text.encode(), fast_gate=True)
+    assert result["risk_level"] == "critical"
+
+
+@pytest.fixture(params=["automaton", "substring"])
+def detector(request, monkeypatch):
+    """Fresh detector scanning with pyahocorasick or the substring fallback"""
+    if request.param == "automaton":
+        if ustad_bias.detector.ahocorasick is None:
+            pytest.skip("pyahocorasick is not installed")
+    else:
+        monkeypatch.setattr(ustad_bias.detector, "ahocorasick", None)
+
+    class Detector(BiasDetector):
+        """Subclass so the cached automata are rebuilt for this test"""
+
+    assert (Detector._get_automaton()._automaton is not None) == (request.param == "automaton")
+    return Detector()
+
+
+SHARED_KEYWORD_TEXT = "mass surveillance with transparent data protection, despite privacy bias"
+
+
+@pytest.mark.parametrize("framework, text, expected", [
+    (ComplianceFramework.UN_HUMAN_RIGHTS, "education platform that respects privacy and dignity", {
+        "framework": "un_human_rights", "valid": True, "violations": [],
+        "compliance_details": {
+            "articles_violated": [], "articles_supported": [1, 12, 26], "compliance_score": 3
+        }
+    }),
+    (ComplianceFramework.UN_HUMAN_RIGHTS, "deny education and restrict freedom of expression", {
+        "framework": "un_human_rights", "valid": False, "violations": [19, 26],
+        "compliance_details": {
+            "articles_violated": [19, 26], "articles_supported": [], "compliance_score": -2
+        }
+    }),
+    (ComplianceFramework.HIPPOCRATIC, "drone targeting built with child labor", {
+        "framework": "hippocratic", "valid": False,
+        "violations": ["military: drone", "military: targeting", "exploitation: child labor"]
+    }),
+    (ComplianceFramework.HIPPOCRATIC, "online learning platform", {
+        "framework": "hippocratic", "valid": True, "violations": []
+    }),
+    (ComplianceFramework.GDPR, "explicit consent, minimal data and delete data on request", {
+        "framework": "gdpr", "valid": True, "violations": [],
+        "gdpr_compliance": {
+            "compliant": True, "requirements_met": 3, "total_requirements": 5,
+            "details": {
+                "consent": True, "data_minimization": True, "right_to_erasure": True,
+                "data_protection": False, "transparency": False
+            }
+        }
+    }),
+    (ComplianceFramework.GDPR, SHARED_KEYWORD_TEXT, {
+        "framework": "gdpr", "valid": False, "violations": [],
+        "gdpr_compliance": {
+            "compliant": False, "requirements_met": 2, "total_requirements": 5,
+            "details": {
+                "consent": False, "data_minimization": False, "right_to_erasure": False,
+                "data_protection": True, "transparency": True
+            }
+        }
+    }),
+    (ComplianceFramework.AI_ETHICS, SHARED_KEYWORD_TEXT, {
+        "framework": "ai_ethics", "valid": True, "violations": [], "ethics_score": 80.0
+    }),
+    (ComplianceFramework.AI_ETHICS, "weapon for military use that can exploit and deceive", {
+        "framework": "ai_ethics", "valid": False,
+        "violations": ["AI ethics score below threshold"], "ethics_score": 0
+    }),
+    (ComplianceFramework.ENVIRONMENTAL, "toxic waste dumping", {
+        "framework": "environmental", "valid": True, "violations": []
+    }),
+])
+def test_validate(detector, framework, text, expected):
+    assert detector.validate(text, framework) == expected
+
+
+def test_detailed_analysis_with_shared_keywords(detector):
+    """Keywords feeding several buckets (surveillance, transparent, privacy) count in each"""
+    result = detector.check(SHARED_KEYWORD_TEXT, verbose=True)
+    assert result["risk_level"] == "high"
+    assert result["detailed_analysis"] == {
+        "word_count": 9,
+        "potential_uses": ["research"],
+        "un_compliance": {
+            "articles_violated": [], "articles_supported": [12], "compliance_score": 1
+        },
+        "hippocratic_compliance": False,
+        "ai_ethics_score": 80.0
+    }
@@ -0,0 +1,56 @@
+"""Tests for the cognitive bias plugin"""
+
+import pytest
+
+import plugin
+
+TEXTS = [
+    "",
+    "A balanced review of the evidence.",
+    "Obviously this always works, I knew it and it is simple.",
+    # Repeated and overlapping indicators: "never" twice, "sure" inside "unsure",
+    # "obvious now" alongside "obviously"
+    "Never say never. I'm unsure, it is obvious now and obviously easy.",
+    "BASED ON the FIRST result we ALREADY INVESTED and it's 100% GUARANTEED",
+]
+
+
+def legacy_details(text):
+    """The original per-indicator substring loop"""
+    text_lower = text.lower()
+    return [
+        {"bias": bias_type, "indicator": indicator, "severity": "medium"}
+        for bias_type, indicators in plugin.COGNITIVE_BIASES.items()
+        for indicator in indicators
+        if indicator in text_lower
+    ]
+
+
+@pytest.fixture(params=["automaton", "substring"])
+def scan_path(request, monkeypatch):
+    if request.param == "automaton":
+        if plugin._COG_AUTO is None:
+            pytest.skip("pyahocorasick is not installed")
+    else:
+        monkeypatch.setattr(plugin, "_COG_AUTO", None)
+    return request.param
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_detect_bias_matches_legacy_loop(scan_path, text):
+    details = legacy_details(text)
+    assert plugin.detect_bias(text) == {
+        "biases_detected": bool(details),
+        "count": len(details),
+        "details": details,
+        "recommendation": "Consider alternative viewpoints" if details else "No obvious biases"
+    }
+
+
+def test_detect_bias_reports_each_indicator_once_in_table_order(scan_path):
+    result = plugin.detect_bias("Never say never, obviously. Never, ever, obviously.")
+    assert [(d["bias"], d["indicator"]) for d in result["details"]] == [
+        ("confirmation", "never"),
+        ("dunning_kruger", "obviously"),
+    ]
+    assert result["count"] == 2